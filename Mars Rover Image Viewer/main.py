@@ -8,7 +8,7 @@ License: MIT License
 
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext, messagebox
-from PIL import ImageTk, Image
+from PIL import ImageTk, Image, ImageOps
 import requests
 from io import BytesIO
 import os
@@ -17,6 +17,492 @@ import re
 from datetime import datetime
 import threading
 import json
+import csv
+import hashlib
+import time
+import sys
+import multiprocessing
+import argparse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+
+try:
+    import psutil
+except ImportError:
+    psutil = None  # Memory readout falls back to /proc on Linux when psutil is not installed
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None  # Parquet export is only available when pyarrow is installed
+    pq = None
+
+# Output formats for the download processing pipeline: (Pillow format, file extension)
+OUTPUT_FORMATS = {
+    'JPEG': ('JPEG', 'jpg'),
+    'PNG': ('PNG', 'png'),
+    'WebP': ('WEBP', 'webp'),
+}
+
+DEFAULT_PROCESSING_OPTIONS = {
+    "maxDimension": 0,
+    "format": "Original",
+    "quality": 90,
+    "contrast": "None",
+}
+
+def get_rss_bytes():
+    # Resident memory of this process, or None when it cannot be read on this platform
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+# Columns written by the metadata export, one row per photo
+MANIFEST_FIELDS = [
+    'id', 'sol', 'earth_date', 'camera_name', 'camera_full_name', 'img_src',
+    'rover_id', 'rover_name', 'rover_status', 'rover_landing_date', 'rover_launch_date',
+]
+
+def flatten_photo(photo):
+    camera = photo.get('camera', {})
+    rover = photo.get('rover', {})
+    return {
+        'id': photo.get('id'),
+        'sol': photo.get('sol'),
+        'earth_date': photo.get('earth_date'),
+        'camera_name': camera.get('name'),
+        'camera_full_name': camera.get('full_name'),
+        'img_src': photo.get('img_src'),
+        'rover_id': rover.get('id'),
+        'rover_name': rover.get('name'),
+        'rover_status': rover.get('status'),
+        'rover_landing_date': rover.get('landing_date'),
+        'rover_launch_date': rover.get('launch_date'),
+    }
+
+def write_manifest(file_path, export_format, batches):
+    # Write each batch of rows as it arrives so a long sol range never has to be held in memory
+    count = 0
+    if export_format == 'Parquet':
+        schema = pa.schema([
+            ('id', pa.int64()), ('sol', pa.int64()), ('earth_date', pa.string()),
+            ('camera_name', pa.string()), ('camera_full_name', pa.string()), ('img_src', pa.string()),
+            ('rover_id', pa.int64()), ('rover_name', pa.string()), ('rover_status', pa.string()),
+            ('rover_landing_date', pa.string()), ('rover_launch_date', pa.string()),
+        ])
+        with pq.ParquetWriter(file_path, schema) as writer:
+            for rows in batches:
+                if rows:
+                    writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+                    count += len(rows)
+    else:
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            if export_format == 'CSV':
+                writer = csv.DictWriter(f, fieldnames=MANIFEST_FIELDS)
+                writer.writeheader()
+            for rows in batches:
+                if export_format == 'CSV':
+                    writer.writerows(rows)
+                else:
+                    for row in rows:
+                        f.write(json.dumps(row) + '\n')
+                count += len(rows)
+    return count
+
+def needs_processing(options):
+    return bool(options["maxDimension"]) or options["format"] != "Original" or options["contrast"] != "None"
+
+def process_image_bytes(img_data, options):
+    # Runs in a worker process for batch downloads, so it only works on the bytes and the options dict
+    if not needs_processing(options):
+        return img_data, 'jpg'
+
+    with Image.open(BytesIO(img_data)) as img:
+        img.load()
+        if img.mode not in ('L', 'RGB'):
+            img = img.convert('RGB')
+
+        max_dimension = options["maxDimension"]
+        if max_dimension:
+            img.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+
+        if options["contrast"] == "Stretch":
+            img = ImageOps.autocontrast(img, cutoff=1)
+        elif options["contrast"] == "Equalize":
+            img = ImageOps.equalize(img)
+
+        # The API serves JPEGs, so "Original" re-encodes as JPEG when other steps changed the pixels
+        pil_format, extension = OUTPUT_FORMATS.get(options["format"], OUTPUT_FORMATS['JPEG'])
+        output = BytesIO()
+        if pil_format == 'PNG':
+            img.save(output, format=pil_format, optimize=True)
+        else:
+            img.save(output, format=pil_format, quality=options["quality"])
+        return output.getvalue(), extension
+
+class DownloadStore:
+    # Downloads are stored as <rover>/<photo id>.<ext> with a manifest of checksums, so repeat runs
+    # can skip files that are already verified and identical images are hard linked instead of copied
+    def __init__(self, download_path):
+        self.download_path = download_path
+        self.manifest_path = os.path.join(download_path, 'manifest.json')
+        self.lock = threading.Lock()
+
+        try:
+            with open(self.manifest_path, 'r') as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+
+        self.checksums = {entry['sha256']: photo_id for photo_id, entry in self.entries.items()}
+
+    def file_path(self, entry):
+        return os.path.join(self.download_path, *entry['file'].split('/'))
+
+    def is_verified(self, entry):
+        # A size that differs from the manifest means the file was truncated or changed after it was written
+        try:
+            return os.path.getsize(self.file_path(entry)) == entry['size']
+        except OSError:
+            return False
+
+    def has_verified(self, photo, options):
+        entry = self.entries.get(str(photo['id']))
+        return entry is not None and entry.get('processing') == options and self.is_verified(entry)
+
+    def store(self, photo, img_data, extension, options):
+        photo_id = str(photo['id'])
+        rover = photo['rover']['name'].lower()
+        relative_path = f"{rover}/{photo_id}.{extension}"
+        file_path = os.path.join(self.download_path, rover, f"{photo_id}.{extension}")
+        checksum = hashlib.sha256(img_data).hexdigest()
+
+        with self.lock:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+            # Remove the previous copy first, it may be a hard link shared with another photo
+            previous = self.entries.get(photo_id)
+            if previous is not None:
+                if self.checksums.get(previous['sha256']) == photo_id:
+                    del self.checksums[previous['sha256']]
+                    # Keep indexing the checksum if another photo still has the same content
+                    for other_id, entry in self.entries.items():
+                        if other_id != photo_id and entry['sha256'] == previous['sha256']:
+                            self.checksums[previous['sha256']] = other_id
+                            break
+                if os.path.exists(self.file_path(previous)):
+                    os.remove(self.file_path(previous))
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+            linked = False
+            duplicate_id = self.checksums.get(checksum)
+            if duplicate_id is not None and self.is_verified(self.entries[duplicate_id]):
+                try:
+                    os.link(self.file_path(self.entries[duplicate_id]), file_path)
+                    linked = True
+                except OSError:
+                    pass  # File systems without hard links get a regular copy
+
+            if not linked:
+                # Write to a temporary file first so an interrupted download never leaves a partial image behind
+                temp_path = file_path + '.part'
+                with open(temp_path, 'wb') as f:
+                    f.write(img_data)
+                os.replace(temp_path, file_path)
+
+            self.entries[photo_id] = {
+                'file': relative_path,
+                'sha256': checksum,
+                'size': len(img_data),
+                'img_src': photo['img_src'],
+                'sol': photo['sol'],
+                'earth_date': photo['earth_date'],
+                'processing': options,
+            }
+            self.checksums.setdefault(checksum, photo_id)
+
+        return file_path, linked
+
+    def save(self):
+        with self.lock:
+            temp_path = self.manifest_path + '.part'
+            with open(temp_path, 'w') as f:
+                json.dump(self.entries, f, indent=4)
+            os.replace(temp_path, self.manifest_path)
+
+class ComparisonPane:
+    # One rover's column in the Compare tab, each pane keeps its own read-ahead and cache budget
+    def __init__(self, parent, rover, image_size, prefetch_depth, cache_budget, font, dark_gray):
+        self.rover = rover
+        self.photos = []
+        self.current_index = 0
+        self.image_size = image_size
+        self.prefetch_depth = prefetch_depth
+        self.cache_budget = cache_budget
+        self.dark_gray = dark_gray
+
+        self.cache = OrderedDict()  # Decoded thumbnails keyed by img_src, least recently used first
+        self.pending = set()
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.closed = False
+        self.tk_photo = None
+        self.root = parent.winfo_toplevel()  # Worker threads hand widget updates to the Tk thread through this
+
+        self.frame = tk.Frame(parent, bg=dark_gray)
+        self.frame.pack(side='left', padx=5, anchor='n')
+
+        self.title_label = tk.Label(self.frame, text=rover, bg=dark_gray, fg='white', font=font)
+        self.title_label.pack()
+
+        self.image_label = tk.Label(self.frame, bg=dark_gray)
+        self.image_label.pack(pady=5)
+        self.placeholder = Image.new('RGB', (image_size, image_size), color=dark_gray)
+        self.display(self.placeholder)
+
+        self.details_label = tk.Label(self.frame, text='Loading...', wraplength=image_size, justify='left', bg=dark_gray, fg='white', font=font)
+        self.details_label.pack()
+
+        self.nav_frame = tk.Frame(self.frame, bg=dark_gray)
+        self.nav_frame.pack(pady=5)
+
+        self.prev_button = tk.Button(self.nav_frame, text='◀', command=self.show_previous, width=2, bg='#333', fg='white', font=font)
+        self.prev_button.pack(side='left')
+
+        self.counter_label = tk.Label(self.nav_frame, text='0/0', bg=dark_gray, fg='white', font=font)
+        self.counter_label.pack(side='left', padx=5)
+
+        self.next_button = tk.Button(self.nav_frame, text='▶', command=self.show_next, width=2, bg='#333', fg='white', font=font)
+        self.next_button.pack(side='left')
+
+    def set_photos(self, photos):
+        if self.closed:
+            return
+        self.photos = photos
+        self.current_index = 0
+        if photos:
+            self.show_current()
+        else:
+            self.details_label.config(text='No images for this date')
+
+    def set_error(self, message):
+        if self.closed:
+            return
+        self.details_label.config(text=message)
+
+    def show_previous(self):
+        if self.current_index > 0:
+            self.current_index -= 1
+            self.show_current()
+
+    def show_next(self):
+        if self.current_index < len(self.photos) - 1:
+            self.current_index += 1
+            self.show_current()
+
+    def show_current(self):
+        photo = self.photos[self.current_index]
+        self.details_label.config(text=f"{photo['camera']['name']}\nSol: {photo['sol']}")
+        self.counter_label.config(text=f'{self.current_index + 1}/{len(self.photos)}')
+
+        with self.lock:
+            frame = self.cache.get(photo['img_src'])
+            if frame is not None:
+                self.cache.move_to_end(photo['img_src'])
+        # Show the placeholder rather than the previous thumbnail under the new caption until this one loads
+        self.display(frame if frame is not None else self.placeholder)
+        self.prefetch()
+
+    def prefetch(self):
+        # Load the current image and the next few so stepping through the pane stays instant
+        for photo in self.photos[self.current_index:self.current_index + 1 + self.prefetch_depth]:
+            url = photo['img_src']
+            with self.lock:
+                if url in self.cache or url in self.pending:
+                    continue
+                self.pending.add(url)
+            self.executor.submit(self.load, url)
+
+    def load(self, img_url):
+        try:
+            response = requests.get(img_url)
+            response.raise_for_status()
+            with Image.open(BytesIO(response.content)) as img:
+                # Let the JPEG decoder scale down while decoding, then size it for the pane
+                img.draft('RGB', (self.image_size, self.image_size))
+                frame = img.resize((self.image_size, self.image_size))
+        except Exception:
+            frame = None
+
+        with self.lock:
+            self.pending.discard(img_url)
+            if frame is None:
+                return
+            self.cache[img_url] = frame
+            # Stay within this pane's budget, keeping the most recently used thumbnails and never the one on screen
+            current_url = self.photos[self.current_index]['img_src'] if self.photos else None
+            while len(self.cache) > self.cache_budget:
+                oldest = next((url for url in self.cache if url != current_url), None)
+                if oldest is None:
+                    break
+                del self.cache[oldest]
+
+        try:
+            self.root.after(0, self.show_loaded, img_url)
+        except (RuntimeError, tk.TclError):
+            pass  # The window was closed while this thumbnail was loading
+
+    def show_loaded(self, img_url):
+        # Runs on the Tk thread, where close() also runs, so the pane cannot be destroyed part way through
+        if self.closed or not self.photos or self.photos[self.current_index]['img_src'] != img_url:
+            return
+        with self.lock:
+            frame = self.cache.get(img_url)
+        if frame is not None:
+            self.display(frame)
+
+    def display(self, frame):
+        # Every thumbnail in the pane is the same size, so one Tk photo is reused for all of them
+        if self.tk_photo is None:
+            self.tk_photo = ImageTk.PhotoImage('RGB', (self.image_size, self.image_size))
+            self.image_label.config(image=self.tk_photo)
+        self.tk_photo.paste(frame)
+
+    def close(self):
+        self.closed = True
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        with self.lock:
+            self.cache.clear()
+        self.photos = []
+        self.frame.destroy()
+        self.tk_photo = None
+
+class RoverWatcher:
+    # Polls latest_photos for each rover and downloads only the photos missing from the local catalogue
+    def __init__(self, api_key, store, rovers, interval, options, notify):
+        self.api_key = api_key
+        self.store = store  # Shared with the viewer's downloads so both write one manifest
+        self.rovers = [rover.lower() for rover in rovers]
+        self.interval = interval  # Seconds between polls
+        self.options = options
+        self.notify = notify  # Called with (message, new_sol)
+        self.session = requests.Session()
+        self.timeout = (10, 60)  # Connect and read timeouts, a stalled request would otherwise hang the watcher
+        self.stop_event = threading.Event()
+
+        # Latest sol and response validators per rover, kept next to the download manifest
+        self.state_path = os.path.join(store.download_path, 'watch.json')
+        try:
+            with open(self.state_path, 'r') as f:
+                self.state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.state = {}
+
+    def run(self):
+        while not self.stop_event.is_set():
+            for rover in self.rovers:
+                if self.stop_event.is_set():
+                    break
+                try:
+                    self.poll(rover)
+                except Exception as e:
+                    self.notify(f"Error watching {rover}: {e}", False)
+            self.stop_event.wait(self.interval)
+
+    def stop(self):
+        self.stop_event.set()
+
+    def poll(self, rover):
+        rover_state = self.state.setdefault(rover, {})
+
+        # Conditional request, an unchanged feed costs a 304 instead of the whole photo list
+        headers = {}
+        if rover_state.get('etag'):
+            headers['If-None-Match'] = rover_state['etag']
+        if rover_state.get('lastModified'):
+            headers['If-Modified-Since'] = rover_state['lastModified']
+
+        url = f'https://api.nasa.gov/mars-photos/api/v1/rovers/{rover}/latest_photos?api_key={self.api_key}'
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304:
+            return
+        response.raise_for_status()
+
+        photos = response.json().get('latest_photos', [])
+        if photos:
+            latest_sol = max(photo['sol'] for photo in photos)
+            previous_sol = rover_state.get('latestSol')
+            complete = True
+            if previous_sol is not None and latest_sol > previous_sol:
+                if latest_sol > rover_state.get('notifiedSol', previous_sol):
+                    self.notify(f"New sol {latest_sol} for {rover.capitalize()} ({len(photos)} images)", True)
+                    rover_state['notifiedSol'] = latest_sol
+                    self.save_state()
+
+                # latest_photos only covers the newest sol, so fetch any sols that arrived since the last poll
+                for sol in range(previous_sol + 1, latest_sol):
+                    if self.stop_event.is_set():
+                        return
+                    complete = self.ingest(rover, sol, self.fetch_sol(rover, sol)) and complete
+
+            complete = self.ingest(rover, latest_sol, photos) and complete
+            if not complete or self.stop_event.is_set():
+                return  # Leave the state alone so the next poll picks up what is still missing
+            rover_state['latestSol'] = latest_sol
+
+        # Only record the validators once everything they cover is ingested, otherwise a 304 would hide the gap
+        rover_state['etag'] = response.headers.get('ETag')
+        rover_state['lastModified'] = response.headers.get('Last-Modified')
+        self.save_state()
+
+    def fetch_sol(self, rover, sol):
+        url = f'https://api.nasa.gov/mars-photos/api/v1/rovers/{rover}/photos?sol={sol}&api_key={self.api_key}'
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json().get('photos', [])
+
+    def ingest(self, rover, sol, photos):
+        # Only fetch what the catalogue does not already have
+        new_photos = [photo for photo in photos if not self.store.has_verified(photo, self.options)]
+        if not new_photos:
+            return True
+
+        saved = 0
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for photo, img_data in zip(new_photos, executor.map(self.fetch_photo, new_photos)):
+                if img_data is None or self.stop_event.is_set():
+                    continue
+                img_data, extension = process_image_bytes(img_data, self.options)
+                self.store.store(photo, img_data, extension, self.options)
+                saved += 1
+        self.store.save()
+        self.notify(f"Downloaded {saved} new images for {rover.capitalize()} sol {sol}", False)
+        return saved == len(new_photos)
+
+    def fetch_photo(self, photo):
+        # Stop queued downloads from starting once the watcher has been stopped
+        if self.stop_event.is_set():
+            return None
+        try:
+            response = self.session.get(photo['img_src'], timeout=self.timeout)
+            response.raise_for_status()
+            return response.content
+        except requests.exceptions.RequestException as e:
+            # The photo is left out of the catalogue, so the next poll retries it
+            self.notify(f"Failed to download {photo['img_src']}: {e}", False)
+            return None
+
+    def save_state(self):
+        temp_path = self.state_path + '.part'
+        with open(temp_path, 'w') as f:
+            json.dump(self.state, f, indent=4)
+        os.replace(temp_path, self.state_path)
 
 class MarsRoverImageViewer:
     def __init__(self, master):
@@ -37,6 +523,53 @@ class MarsRoverImageViewer:
         self.photos = []
         self.image_displayed = False  # Track if an image is currently being displayed
 
+        # Playback state
+        self.playing = False
+        self.frame_buffer = {}  # Decoded frames keyed by img_src, filled ahead of the current image
+        self.frame_buffer_lock = threading.Lock()
+        self.frame_buffer_size = 10  # Number of frames to keep decoded ahead of the current one
+        self.playback_generation = 0  # Bumped on every stop so an old tick chain or buffer thread ends
+        self.playback_after_id = None
+        self.playback_rover = ''
+        self.playback_sol = None
+        self.playback_end_sol = None
+        self.playback_next = None  # (sol, photos) of the next sol in the range, (None, []) when there is none
+        self.strip_columns = 10  # Frames per row when exporting an image strip
+        self.failed_frames = {}  # img_src -> (failed attempts, monotonic time of the next retry)
+
+        # Zoom state, the full resolution image is decoded once and only the visible part is rendered
+        self.full_image = None
+        self.full_image_url = None
+        self.fit_frame = None
+        self.zoom_levels = [0.25, 0.5, 1.0, 2.0, 4.0]  # Scale relative to the native resolution
+        self.zoom_index = None  # None means the image is fitted to the pane
+        self.view_x = 0  # Top left corner of the viewport in scaled image pixels
+        self.view_y = 0
+        self.pan_start = None
+        self.tile_size = 256
+        self.tile_cache = OrderedDict()  # Rendered tiles keyed by (zoom index, column, row)
+        self.tile_cache_limit = 256
+
+        # Photo manifests already fetched this session, keyed by (rover, sol)
+        self.manifest_cache = OrderedDict()
+        self.manifest_cache_lock = threading.Lock()
+        self.manifest_cache_limit = 100
+        self.export_retries = 3  # Attempts per sol after the first during a range export
+
+        self.download_store = None
+        self.batch_in_flight = 8  # Images downloading or processing at once during Download All
+
+        self.comparison_panes = []
+
+        self.watcher = None
+        self.watch_thread = None
+
+        # Image lifecycle, one worker loads the main pane image and one Tk photo is reused for every frame
+        self.image_loader = ThreadPoolExecutor(max_workers=2)
+        self.pending_fetch = None
+        self.pane_photo = None
+        self.placeholder_frame = Image.new("RGB", (400, 400), color=self.dark_gray)
+
         # Create widgets
         self.tabControl = ttk.Notebook(master)
         self.tabControl.pack(expand=1, fill="both")
@@ -50,21 +583,38 @@ class MarsRoverImageViewer:
         self.tab3 = ttk.Frame(self.tabControl)
         self.tabControl.add(self.tab3, text="About")
 
+        self.tab4 = ttk.Frame(self.tabControl)
+        self.tabControl.insert(self.tab3, self.tab4, text="Export")
+
+        self.tab5 = ttk.Frame(self.tabControl)
+        self.tabControl.insert(self.tab3, self.tab5, text="Compare")
+
         self.image_frame = tk.Frame(self.tab1, bg=self.dark_gray)
         self.image_frame.pack(side="top", fill="both", expand=True)
 
         self.image_label = tk.Label(self.image_frame)
         self.image_label.pack(pady=10)
 
+        # Zoom with the mouse wheel, drag to pan and double-click to fit the image back into the pane
+        self.image_label.bind('<MouseWheel>', self.zoom_image)
+        self.image_label.bind('<Button-4>', self.zoom_image)
+        self.image_label.bind('<Button-5>', self.zoom_image)
+        self.image_label.bind('<ButtonPress-1>', self.start_pan)
+        self.image_label.bind('<B1-Motion>', self.pan_image)
+        self.image_label.bind('<Double-Button-1>', self.reset_zoom)
+
         self.details_label = tk.Label(self.tab1, text='', wraplength=400, justify='left', bg=self.dark_gray, fg='white')
         self.details_label.pack(pady=5)
 
         self.button_frame_top = tk.Frame(self.tab1, bg=self.dark_gray)
         self.button_frame_top.pack(pady=10)
 
-        self.download_button = tk.Button(self.button_frame_top, text='Download Image', command=self.download_image, width=20, bg='#333', fg='white')  # Set button colors
+        self.download_button = tk.Button(self.button_frame_top, text='Download Image', command=self.download_image, width=16, bg='#333', fg='white')  # Set button colors
         self.download_button.pack(side='left', padx=(10, 5))
 
+        self.download_all_button = tk.Button(self.button_frame_top, text='Download All', command=self.download_all_images, width=16, bg='#333', fg='white')  # Set button colors
+        self.download_all_button.pack(side='left', padx=(5, 5))
+
         self.fetch_recent_button = tk.Button(self.button_frame_top, text='Fetch Recent Images', command=self.fetch_recent_images, width=20, bg='#333', fg='white')  # Set button colors
         self.fetch_recent_button.pack(side='left', padx=(5, 10))
 
@@ -144,6 +694,28 @@ class MarsRoverImageViewer:
         self.fetch_button = tk.Button(self.date_frame, text='Search', command=self.fetch_and_display_images, width=7, bg='#333', fg='white')  # Set button colors
         self.fetch_button.pack(side='left', padx=(5, 10))
 
+        self.playback_frame = tk.Frame(self.tab1, bg=self.dark_gray)
+        self.playback_frame.pack(pady=5)
+
+        self.fps_label = tk.Label(self.playback_frame, text='FPS:', bg=self.dark_gray, fg='white')
+        self.fps_label.pack(side='left')
+
+        self.fps_entry = tk.Entry(self.playback_frame, width=4, bg='#333', fg='white')
+        self.fps_entry.insert(0, '5')
+        self.fps_entry.pack(side='left', padx=(0, 10))
+
+        self.end_sol_label = tk.Label(self.playback_frame, text='Until sol:', bg=self.dark_gray, fg='white')
+        self.end_sol_label.pack(side='left')
+
+        self.end_sol_entry = tk.Entry(self.playback_frame, width=6, bg='#333', fg='white')
+        self.end_sol_entry.pack(side='left', padx=(0, 10))
+
+        self.play_button = tk.Button(self.playback_frame, text='Play', command=self.toggle_playback, width=7, bg='#333', fg='white')
+        self.play_button.pack(side='left', padx=(5, 5))
+
+        self.export_sequence_button = tk.Button(self.playback_frame, text='Export', command=self.export_sequence, width=7, bg='#333', fg='white')
+        self.export_sequence_button.pack(side='left', padx=(5, 10))
+
         # Create a button to fetch the saved image
         #self.fetch_saved_image_button = tk.Button(self.tab1, text='Load Saved Image', command=self.load_saved_image_info, width=40, bg='#333', fg='white')
         #self.fetch_saved_image_button.pack(pady=10) 
@@ -198,6 +770,188 @@ class MarsRoverImageViewer:
         self.save_path_button = tk.Button(self.path_frame, text="Save", command=self.save_download_path, bg='#333', fg='white')
         self.save_path_button.pack(side='left', padx=(5, 10))
 
+        # Frame for the download processing options
+        self.processing_frame = tk.Frame(self.settings_frame, bg=self.dark_gray)
+        self.processing_frame.pack(pady=5)
+
+        self.processing_label = tk.Label(self.processing_frame, text='Download Processing', bg=self.dark_gray, fg='white')
+        self.processing_label.pack(side='top', pady=(0, 5))
+
+        processing_options = self.load_processing_options()
+
+        self.processing_row_top = tk.Frame(self.processing_frame, bg=self.dark_gray)
+        self.processing_row_top.pack(pady=5)
+
+        self.max_dimension_label = tk.Label(self.processing_row_top, text='Max Size (px):', bg=self.dark_gray, fg='white')
+        self.max_dimension_label.pack(side='left')
+
+        self.max_dimension_entry = tk.Entry(self.processing_row_top, width=6, bg='#333', fg='white')
+        self.max_dimension_entry.insert(0, str(processing_options["maxDimension"]))
+        self.max_dimension_entry.pack(side='left', padx=(0, 10))
+
+        self.format_label = tk.Label(self.processing_row_top, text='Format:', bg=self.dark_gray, fg='white')
+        self.format_label.pack(side='left')
+
+        self.selected_format = tk.StringVar(value=processing_options["format"])
+        self.format_menu = tk.OptionMenu(self.processing_row_top, self.selected_format, 'Original', *OUTPUT_FORMATS)
+        self.format_menu.config(bg='#333', fg='white', highlightthickness=0)
+        self.format_menu.pack(side='left')
+
+        self.processing_row_bottom = tk.Frame(self.processing_frame, bg=self.dark_gray)
+        self.processing_row_bottom.pack(pady=5)
+
+        self.quality_label = tk.Label(self.processing_row_bottom, text='Quality:', bg=self.dark_gray, fg='white')
+        self.quality_label.pack(side='left')
+
+        self.quality_entry = tk.Entry(self.processing_row_bottom, width=4, bg='#333', fg='white')
+        self.quality_entry.insert(0, str(processing_options["quality"]))
+        self.quality_entry.pack(side='left', padx=(0, 10))
+
+        self.contrast_label = tk.Label(self.processing_row_bottom, text='Contrast:', bg=self.dark_gray, fg='white')
+        self.contrast_label.pack(side='left')
+
+        self.selected_contrast = tk.StringVar(value=processing_options["contrast"])
+        self.contrast_menu = tk.OptionMenu(self.processing_row_bottom, self.selected_contrast, 'None', 'Stretch', 'Equalize')
+        self.contrast_menu.config(bg='#333', fg='white', highlightthickness=0)
+        self.contrast_menu.pack(side='left')
+
+        self.save_processing_button = tk.Button(self.processing_row_bottom, text="Save", command=self.save_processing_options, bg='#333', fg='white')
+        self.save_processing_button.pack(side='left', padx=(10, 10))
+
+        # Frame for watching rovers for new sols
+        self.watch_frame = tk.Frame(self.settings_frame, bg=self.dark_gray)
+        self.watch_frame.pack(pady=5)
+
+        self.watch_label = tk.Label(self.watch_frame, text='Watch for New Images', bg=self.dark_gray, fg='white')
+        self.watch_label.pack(side='top', pady=(0, 5))
+
+        watch_settings = self.load_watch_settings()
+
+        self.watch_rover_frame = tk.Frame(self.watch_frame, bg=self.dark_gray)
+        self.watch_rover_frame.pack(pady=5)
+
+        self.watch_rovers = {}
+        self.watch_checkbuttons = []
+        for rover in ['Curiosity', 'Opportunity', 'Spirit', 'Perseverance']:
+            selected = tk.BooleanVar(value=rover in watch_settings["rovers"])
+            checkbutton = tk.Checkbutton(self.watch_rover_frame, text=rover, variable=selected, bg=self.dark_gray, fg='white', selectcolor=self.dark_gray)
+            checkbutton.pack(side='left', padx=5)
+            self.watch_rovers[rover] = selected
+            self.watch_checkbuttons.append(checkbutton)
+
+        self.watch_options_frame = tk.Frame(self.watch_frame, bg=self.dark_gray)
+        self.watch_options_frame.pack(pady=5)
+
+        self.watch_interval_label = tk.Label(self.watch_options_frame, text='Every (minutes):', bg=self.dark_gray, fg='white')
+        self.watch_interval_label.pack(side='left')
+
+        self.watch_interval_entry = tk.Entry(self.watch_options_frame, width=4, bg='#333', fg='white')
+        self.watch_interval_entry.insert(0, str(watch_settings["intervalMinutes"]))
+        self.watch_interval_entry.pack(side='left', padx=(0, 10))
+
+        self.watch_button = tk.Button(self.watch_options_frame, text='Start Watching', command=self.toggle_watch, width=14, bg='#333', fg='white')
+        self.watch_button.pack(side='left')
+
+        # Memory readout, refreshed every few seconds
+        self.memory_label = tk.Label(self.settings_frame, text='', justify='left', bg=self.dark_gray, fg='white')
+        self.memory_label.pack(pady=10)
+
+        self.export_frame = tk.Frame(self.tab4, bg=self.dark_gray)
+        self.export_frame.pack(pady=10)
+
+        self.export_label = tk.Label(self.export_frame, text='Export Photo Metadata', bg=self.dark_gray, fg='white')
+        self.export_label.pack(side='top', pady=(0, 5))
+
+        self.export_range_frame = tk.Frame(self.export_frame, bg=self.dark_gray)
+        self.export_range_frame.pack(pady=5)
+
+        self.export_rover_label = tk.Label(self.export_range_frame, text='Rover:', bg=self.dark_gray, fg='white')
+        self.export_rover_label.pack(side='left')
+
+        self.export_rover = tk.StringVar(value='Curiosity')
+        self.export_rover_menu = tk.OptionMenu(self.export_range_frame, self.export_rover, 'Curiosity', 'Opportunity', 'Spirit', 'Perseverance')
+        self.export_rover_menu.config(bg='#333', fg='white', highlightthickness=0)
+        self.export_rover_menu.pack(side='left', padx=(0, 10))
+
+        self.export_start_label = tk.Label(self.export_range_frame, text='Sols:', bg=self.dark_gray, fg='white')
+        self.export_start_label.pack(side='left')
+
+        self.export_start_entry = tk.Entry(self.export_range_frame, width=6, bg='#333', fg='white')
+        self.export_start_entry.pack(side='left')
+
+        self.export_end_label = tk.Label(self.export_range_frame, text='to', bg=self.dark_gray, fg='white')
+        self.export_end_label.pack(side='left', padx=5)
+
+        self.export_end_entry = tk.Entry(self.export_range_frame, width=6, bg='#333', fg='white')
+        self.export_end_entry.pack(side='left')
+
+        self.export_buttons_frame = tk.Frame(self.export_frame, bg=self.dark_gray)
+        self.export_buttons_frame.pack(pady=5)
+
+        self.export_format_label = tk.Label(self.export_buttons_frame, text='Format:', bg=self.dark_gray, fg='white')
+        self.export_format_label.pack(side='left')
+
+        self.export_format = tk.StringVar(value='CSV')
+        self.export_format_menu = tk.OptionMenu(self.export_buttons_frame, self.export_format, 'CSV', 'JSON Lines', 'Parquet')
+        self.export_format_menu.config(bg='#333', fg='white', highlightthickness=0)
+        self.export_format_menu.pack(side='left', padx=(0, 10))
+
+        self.export_loaded_button = tk.Button(self.export_buttons_frame, text='Export Loaded', command=self.export_loaded_manifest, bg='#333', fg='white')
+        self.export_loaded_button.pack(side='left', padx=5)
+
+        self.export_range_button = tk.Button(self.export_buttons_frame, text='Export Range', command=self.export_manifest_range, bg='#333', fg='white')
+        self.export_range_button.pack(side='left', padx=5)
+
+        self.export_status_label = tk.Label(self.export_frame, text='', wraplength=500, bg=self.dark_gray, fg='white')
+        self.export_status_label.pack(pady=5)
+
+        self.compare_frame = tk.Frame(self.tab5, bg=self.dark_gray)
+        self.compare_frame.pack(pady=10)
+
+        self.compare_rover_frame = tk.Frame(self.compare_frame, bg=self.dark_gray)
+        self.compare_rover_frame.pack(pady=5)
+
+        self.compare_rovers = {}
+        self.compare_checkbuttons = []
+        for rover in ['Curiosity', 'Opportunity', 'Spirit', 'Perseverance']:
+            selected = tk.BooleanVar(value=rover in ('Curiosity', 'Perseverance'))
+            checkbutton = tk.Checkbutton(self.compare_rover_frame, text=rover, variable=selected, bg=self.dark_gray, fg='white', selectcolor=self.dark_gray)
+            checkbutton.pack(side='left', padx=5)
+            self.compare_rovers[rover] = selected
+            self.compare_checkbuttons.append(checkbutton)
+
+        self.compare_options_frame = tk.Frame(self.compare_frame, bg=self.dark_gray)
+        self.compare_options_frame.pack(pady=5)
+
+        self.compare_date_label = tk.Label(self.compare_options_frame, text='Earth Date:', bg=self.dark_gray, fg='white')
+        self.compare_date_label.pack(side='left')
+
+        self.compare_date_entry = tk.Entry(self.compare_options_frame, width=11, bg='#333', fg='white')
+        self.compare_date_entry.pack(side='left', padx=(0, 10))
+
+        self.compare_prefetch_label = tk.Label(self.compare_options_frame, text='Prefetch:', bg=self.dark_gray, fg='white')
+        self.compare_prefetch_label.pack(side='left')
+
+        self.compare_prefetch_entry = tk.Entry(self.compare_options_frame, width=3, bg='#333', fg='white')
+        self.compare_prefetch_entry.insert(0, '3')
+        self.compare_prefetch_entry.pack(side='left', padx=(0, 10))
+
+        self.compare_cache_label = tk.Label(self.compare_options_frame, text='Cache:', bg=self.dark_gray, fg='white')
+        self.compare_cache_label.pack(side='left')
+
+        self.compare_cache_entry = tk.Entry(self.compare_options_frame, width=3, bg='#333', fg='white')
+        self.compare_cache_entry.insert(0, '20')
+        self.compare_cache_entry.pack(side='left', padx=(0, 10))
+
+        self.compare_button = tk.Button(self.compare_options_frame, text='Load', command=self.load_comparison, width=6, bg='#333', fg='white')
+        self.compare_button.pack(side='left')
+
+        self.compare_status_label = tk.Label(self.compare_frame, text='Choose rovers and an earth date (YYYY-MM-DD) to compare.', wraplength=500, bg=self.dark_gray, fg='white')
+        self.compare_status_label.pack(pady=5)
+
+        self.compare_panes_frame = tk.Frame(self.tab5, bg=self.dark_gray)
+        self.compare_panes_frame.pack(pady=5)
+
         self.about_text = scrolledtext.ScrolledText(self.tab3, wrap=tk.WORD, width=60, height=10, bg='#333', fg='white')  # Set text widget colors
         self.about_text.pack(pady=10, padx=10, fill='both', expand=True)
         self.load_readme()
@@ -252,6 +1006,52 @@ class MarsRoverImageViewer:
         self.advance_100_sol_button.config(font=self.custom_font)
         self.sol_label.config(font=self.custom_font)
         self.image_button_group_label.config(font=self.custom_font)
+        self.fps_label.config(font=self.custom_font)
+        self.fps_entry.config(font=self.custom_font)
+        self.end_sol_label.config(font=self.custom_font)
+        self.end_sol_entry.config(font=self.custom_font)
+        self.play_button.config(font=self.custom_font)
+        self.export_sequence_button.config(font=self.custom_font)
+        self.download_all_button.config(font=self.custom_font)
+        self.processing_label.config(font=self.custom_font)
+        self.max_dimension_label.config(font=self.custom_font)
+        self.max_dimension_entry.config(font=self.custom_font)
+        self.format_label.config(font=self.custom_font)
+        self.format_menu.config(font=self.custom_font)
+        self.quality_label.config(font=self.custom_font)
+        self.quality_entry.config(font=self.custom_font)
+        self.contrast_label.config(font=self.custom_font)
+        self.contrast_menu.config(font=self.custom_font)
+        self.save_processing_button.config(font=self.custom_font)
+        self.memory_label.config(font=self.custom_font)
+        self.watch_label.config(font=self.custom_font)
+        for checkbutton in self.watch_checkbuttons:
+            checkbutton.config(font=self.custom_font)
+        self.watch_interval_label.config(font=self.custom_font)
+        self.watch_interval_entry.config(font=self.custom_font)
+        self.watch_button.config(font=self.custom_font)
+        self.export_label.config(font=self.custom_font)
+        self.export_rover_label.config(font=self.custom_font)
+        self.export_rover_menu.config(font=self.custom_font)
+        self.export_start_label.config(font=self.custom_font)
+        self.export_start_entry.config(font=self.custom_font)
+        self.export_end_label.config(font=self.custom_font)
+        self.export_end_entry.config(font=self.custom_font)
+        self.export_format_label.config(font=self.custom_font)
+        self.export_format_menu.config(font=self.custom_font)
+        self.export_loaded_button.config(font=self.custom_font)
+        self.export_range_button.config(font=self.custom_font)
+        self.export_status_label.config(font=self.custom_font)
+        for checkbutton in self.compare_checkbuttons:
+            checkbutton.config(font=self.custom_font)
+        self.compare_date_label.config(font=self.custom_font)
+        self.compare_date_entry.config(font=self.custom_font)
+        self.compare_prefetch_label.config(font=self.custom_font)
+        self.compare_prefetch_entry.config(font=self.custom_font)
+        self.compare_cache_label.config(font=self.custom_font)
+        self.compare_cache_entry.config(font=self.custom_font)
+        self.compare_button.config(font=self.custom_font)
+        self.compare_status_label.config(font=self.custom_font)
 
         # Set minimum height and width of the window
         self.master.minsize(625, 900)
@@ -262,23 +1062,207 @@ class MarsRoverImageViewer:
 
         self.sol = None
 
-    def display_image(self, img_data):
-        # Display the image
+        self.update_memory_readout()
+
+    def decode_image(self, img_data):
+        # Decode the raw bytes into a frame sized for the image pane
         with Image.open(BytesIO(img_data)) as img:
-            img = img.resize((400, 400))
-            img = ImageTk.PhotoImage(img)
-            self.image_label.config(image=img)
-            self.image_label.image = img
+            return img.resize((400, 400))
+
+    def is_current_image(self, img_url):
+        return bool(self.photos) and self.photos[self.current_index]['img_src'] == img_url
+
+    def display_image(self, img_data, img_url=None):
+        # Ignore images that finished loading after the user moved on
+        if img_url is not None and not self.is_current_image(img_url):
+            return
+
+        # Keep the decoded full resolution image so zooming never has to decode it again
+        img = Image.open(BytesIO(img_data))
+        img.load()
+        fit_frame = img.resize((400, 400))
+
+        # Swap images on the Tk thread so nothing is still rendering tiles from the one being released
+        self.master.after(0, self.set_full_image, img_url, img, fit_frame)
+
+    def set_full_image(self, img_url, img, fit_frame):
+        if img_url is not None and not self.is_current_image(img_url):
+            img.close()
+            return
+
+        self.release_full_image()
+        self.full_image = img
+        self.full_image_url = img_url
+        self.fit_frame = fit_frame
+        self.zoom_index = None
+
+        # Display the image
+        self.show_frame(self.fit_frame)
+
+    def release_full_image(self):
+        # Free the decoded full resolution image and every tile rendered from it
+        if self.full_image is not None:
+            self.full_image.close()
+        self.full_image = None
+        self.full_image_url = None
+        self.fit_frame = None
+        self.tile_cache.clear()
+
+    def show_frame(self, frame):
+        # Every frame in the pane is 400x400, so one Tk photo is reused instead of creating one per image
+        if self.pane_photo is None:
+            self.pane_photo = ImageTk.PhotoImage('RGB', (400, 400))
+            self.image_label.config(image=self.pane_photo)
+            self.image_label.image = self.pane_photo
+        self.pane_photo.paste(frame)
+
+    def request_image(self, img_url):
+        # Only the newest request matters, so drop one that is still waiting for a worker
+        if self.pending_fetch is not None:
+            self.pending_fetch.cancel()
+        self.pending_fetch = self.image_loader.submit(self.fetch_image, img_url)
 
     def fetch_image(self, img_url):
+        if not self.is_current_image(img_url):
+            return
+
         try:
             # Fetch the image data
             img_response = requests.get(img_url)
             img_response.raise_for_status()  # Raise an exception for non-200 responses
             img_data = img_response.content
-            self.display_image(img_data)
+            img_response.close()
+            del img_response  # Only keep one copy of the raw bytes while decoding
+            self.display_image(img_data, img_url)
         except requests.exceptions.RequestException as e:
             self.display_message(f'Failed to fetch image: {e}')
+        except OSError as e:
+            # This runs in an image_loader future whose result is never read, so report decode errors here
+            self.display_message(f'Failed to decode image: {e}')
+
+    def zoom_image(self, event):
+        if self.playing or not self.photos:
+            return
+
+        img_url = self.photos[self.current_index]['img_src']
+        if self.full_image is None or self.full_image_url != img_url:
+            # Playback frames are only kept at pane size, so load the full resolution image first
+            self.display_message("Loading full resolution image...")
+            self.request_image(img_url)
+            return
+
+        width, height = self.full_image.size
+        fit_scale = min(400 / width, 400 / height)
+        zoom_in = event.num == 4 or event.delta > 0
+
+        if zoom_in:
+            if self.zoom_index is None:
+                larger = [i for i, level in enumerate(self.zoom_levels) if level > fit_scale]
+                if not larger:
+                    return
+                new_index = larger[0]
+            elif self.zoom_index < len(self.zoom_levels) - 1:
+                new_index = self.zoom_index + 1
+            else:
+                return
+        else:
+            if self.zoom_index is None:
+                return
+            if self.zoom_index == 0 or self.zoom_levels[self.zoom_index - 1] <= fit_scale:
+                self.reset_zoom()
+                return
+            new_index = self.zoom_index - 1
+
+        # Keep the pixel under the pointer in place while zooming
+        pointer_x, pointer_y = self.get_viewport_position(event)
+        if self.zoom_index is None:
+            source_x = pointer_x * width / 400
+            source_y = pointer_y * height / 400
+        else:
+            scale = self.zoom_levels[self.zoom_index]
+            source_x = (self.view_x + pointer_x) / scale
+            source_y = (self.view_y + pointer_y) / scale
+
+        scale = self.zoom_levels[new_index]
+        self.zoom_index = new_index
+        self.view_x = source_x * scale - pointer_x
+        self.view_y = source_y * scale - pointer_y
+        self.render_viewport()
+
+    def get_viewport_position(self, event):
+        # The image is centred in the label, so remove the label's padding from the pointer position
+        pad_x = max(0, (self.image_label.winfo_width() - 400) / 2)
+        pad_y = max(0, (self.image_label.winfo_height() - 400) / 2)
+        return event.x - pad_x, event.y - pad_y
+
+    def start_pan(self, event):
+        self.pan_start = (event.x, event.y)
+
+    def pan_image(self, event):
+        if self.zoom_index is None or self.pan_start is None:
+            return
+
+        self.view_x -= event.x - self.pan_start[0]
+        self.view_y -= event.y - self.pan_start[1]
+        self.pan_start = (event.x, event.y)
+        self.render_viewport()
+
+    def reset_zoom(self, event=None):
+        if self.zoom_index is None or self.fit_frame is None:
+            return
+
+        self.zoom_index = None
+        self.show_frame(self.fit_frame)
+
+    def render_viewport(self):
+        scale = self.zoom_levels[self.zoom_index]
+        width, height = self.full_image.size
+        scaled_width, scaled_height = int(width * scale), int(height * scale)
+
+        # Keep the viewport on the image, centring it when the image is smaller than the pane
+        if scaled_width <= 400:
+            self.view_x = (scaled_width - 400) / 2
+        else:
+            self.view_x = min(max(0, self.view_x), scaled_width - 400)
+        if scaled_height <= 400:
+            self.view_y = (scaled_height - 400) / 2
+        else:
+            self.view_y = min(max(0, self.view_y), scaled_height - 400)
+
+        # Only the tiles that overlap the viewport are rendered
+        viewport = Image.new('RGB', (400, 400), color=self.dark_gray)
+        first_column = max(0, int(self.view_x // self.tile_size))
+        last_column = min((scaled_width - 1) // self.tile_size, int((self.view_x + 399) // self.tile_size))
+        first_row = max(0, int(self.view_y // self.tile_size))
+        last_row = min((scaled_height - 1) // self.tile_size, int((self.view_y + 399) // self.tile_size))
+
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                tile = self.get_tile(column, row, scale, scaled_width, scaled_height)
+                viewport.paste(tile, (int(column * self.tile_size - self.view_x), int(row * self.tile_size - self.view_y)))
+
+        self.show_frame(viewport)
+
+    def get_tile(self, column, row, scale, scaled_width, scaled_height):
+        key = (self.zoom_index, column, row)
+        tile = self.tile_cache.get(key)
+        if tile is not None:
+            self.tile_cache.move_to_end(key)
+            return tile
+
+        left = column * self.tile_size
+        top = row * self.tile_size
+        right = min(left + self.tile_size, scaled_width)
+        bottom = min(top + self.tile_size, scaled_height)
+
+        # Resample just this tile's region of the full image, nearest neighbour keeps pixels sharp when magnified
+        resample = Image.NEAREST if scale >= 1 else Image.BILINEAR
+        tile = self.full_image.resize((right - left, bottom - top), resample, box=(left / scale, top / scale, right / scale, bottom / scale))
+
+        self.tile_cache[key] = tile
+        if len(self.tile_cache) > self.tile_cache_limit:
+            self.tile_cache.popitem(last=False)
+        return tile
 
     def show_previous_image(self):
         if self.current_index > 0:
@@ -316,25 +1300,134 @@ class MarsRoverImageViewer:
             self.display_message("Configure download path in the Settings tab.")
             return
 
-        rover_name = self.photos[self.current_index]['rover']['name']
-        earth_date = self.photos[self.current_index]['earth_date']
-        image_number = self.current_index + 1  # Image number
-        file_name = f"{rover_name}_{earth_date}_Image{image_number}.jpg"
-        img_url = self.photos[self.current_index]['img_src']
+        options = self.get_processing_options()
+        if options is None:
+            return
+
+        photo = self.photos[self.current_index]
+        store = self.get_download_store(download_path)
+        if store.has_verified(photo, options):
+            self.display_message("Image already downloaded.")
+            return
 
-        file_path = os.path.join(download_path, file_name)
+        img_data = self.fetch_image_bytes(photo['img_src'])
+        if img_data is None:
+            return
 
         try:
-            response = requests.get(img_url)
-            if response.status_code == 200:
-                with open(file_path, 'wb') as f:
-                    f.write(response.content)
-                self.display_message("Image downloaded successfully.")
+            img_data, extension = process_image_bytes(img_data, options)
+            file_path, linked = store.store(photo, img_data, extension, options)
+            store.save()
+            if linked:
+                self.display_message(f"Image is identical to one already downloaded, linked as {file_path}")
             else:
-                self.display_message(f"Failed to download image. Status code: {response.status_code}")
+                self.display_message("Image downloaded successfully.")
         except Exception as e:
             self.display_message(f"Error downloading image: {e}")
 
+    def download_all_images(self):
+        # Check if download path is set
+        download_path = self.download_path_entry.get()
+        if not download_path:
+            self.display_message("Configure download path in the Settings tab.")
+            return
+
+        options = self.get_processing_options()
+        if options is None:
+            return
+
+        if not self.photos:
+            self.display_message("Search for images before downloading.")
+            return
+
+        threading.Thread(target=self.download_batch, args=(self.get_download_store(download_path), list(self.photos), options)).start()
+
+    def get_download_store(self, download_path):
+        # Reuse the loaded manifest until the download path changes
+        if self.download_store is None or self.download_store.download_path != download_path:
+            self.download_store = DownloadStore(download_path)
+        return self.download_store
+
+    def download_batch(self, store, photos, options):
+        # Skip photos whose files are already on disk and match the manifest
+        pending = [photo for photo in photos if not store.has_verified(photo, options)]
+        skipped = len(photos) - len(pending)
+        self.display_message(f"Downloading {len(pending)} images ({skipped} already downloaded)...")
+        saved = 0
+        linked = 0
+
+        def save(photo, img_data, extension):
+            nonlocal saved, linked
+            if store.store(photo, img_data, extension, options)[1]:
+                linked += 1
+            saved += 1
+            # Save the manifest every so often so an interrupted batch keeps its progress
+            if saved % 25 == 0:
+                store.save()
+
+        # Transfers run on threads and processing on a process pool, so each image is processed and written while the rest are
+        # still downloading. Workers are spawned rather than forked, forking a process with Tk and live threads can deadlock.
+        processor = ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) if needs_processing(options) else None
+        try:
+            with ThreadPoolExecutor(max_workers=4) as downloader:
+                # Only a few images are in flight at once, so a large sol never holds the whole batch in memory
+                queued = iter(pending)
+                in_flight = {}  # Future -> (photo, True while downloading or False while processing)
+
+                def submit_downloads():
+                    while len(in_flight) < self.batch_in_flight:
+                        photo = next(queued, None)
+                        if photo is None:
+                            return
+                        in_flight[downloader.submit(self.fetch_image_bytes, photo['img_src'])] = (photo, True)
+
+                submit_downloads()
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        photo, downloading = in_flight.pop(future)
+                        if downloading:
+                            img_data = future.result()
+                            if img_data is None:
+                                continue
+                            if processor is not None:
+                                in_flight[processor.submit(process_image_bytes, img_data, options)] = (photo, False)
+                            else:
+                                save(photo, img_data, 'jpg')
+                        else:
+                            try:
+                                img_data, extension = future.result()
+                            except Exception as e:
+                                self.display_message(f"Error processing image: {e}")
+                                continue
+                            save(photo, img_data, extension)
+                        del img_data
+                    submit_downloads()
+        except Exception as e:
+            self.display_message(f"Error downloading images: {e}")
+        finally:
+            if processor is not None:
+                processor.shutdown()
+            store.save()
+
+        self.display_message(f"{saved} of {len(pending)} images downloaded successfully ({linked} linked as duplicates, {skipped} skipped).")
+
+    def fetch_image_bytes(self, img_url):
+        try:
+            response = requests.get(img_url)
+            response.raise_for_status()
+            img_data = response.content
+        except requests.exceptions.RequestException as e:
+            self.display_message(f"Failed to download image: {e}")
+            return None
+
+        # Reject transfers that ended early instead of saving a truncated image
+        expected_size = response.headers.get('Content-Length')
+        if expected_size and 'Content-Encoding' not in response.headers and int(expected_size) != len(img_data):
+            self.display_message(f"Download of {img_url} was truncated ({len(img_data)} of {expected_size} bytes).")
+            return None
+        return img_data
+
     def check_api_key(self):
         url = f'https://api.nasa.gov/mars-photos/api/v1/rovers/curiosity/photos?sol=1000&api_key={self.api_key}'
         try:
@@ -344,6 +1437,11 @@ class MarsRoverImageViewer:
             return False
 
     def display_message(self, message):
+        # Worker threads hand the message to the Tk thread, which owns the console
+        if threading.current_thread() is not threading.main_thread():
+            self.master.after(0, self.display_message, message)
+            return
+
         # Insert the new message
         self.console.insert(tk.END, f'{message}\n')
         self.console.see(tk.END)
@@ -366,6 +1464,54 @@ class MarsRoverImageViewer:
             print("File not found")
             return ''
 
+    def load_processing_options(self):
+        options = dict(DEFAULT_PROCESSING_OPTIONS)
+        try:
+            with open('settings.json', 'r') as f:
+                settings = json.load(f)
+                options.update(settings.get("processing", {}))
+        except FileNotFoundError:
+            print("File not found")
+        return options
+
+    def get_processing_options(self):
+        # Read the processing options from the Settings tab, reporting any invalid values
+        max_dimension = self.max_dimension_entry.get().strip() or '0'
+        quality = self.quality_entry.get().strip()
+
+        if not max_dimension.isdigit():
+            self.display_message("Max size must be a whole number of pixels (0 keeps the original size).")
+            return None
+        if not quality.isdigit() or not 1 <= int(quality) <= 100:
+            self.display_message("Quality must be a number between 1 and 100.")
+            return None
+
+        return {
+            "maxDimension": int(max_dimension),
+            "format": self.selected_format.get(),
+            "quality": int(quality),
+            "contrast": self.selected_contrast.get(),
+        }
+
+    def save_processing_options(self):
+        options = self.get_processing_options()
+        if options is None:
+            messagebox.showerror("Error", "Processing options are not valid.")
+            return
+
+        try:
+            with open('settings.json', 'r') as f:
+                settings = json.load(f)
+        except FileNotFoundError:
+            settings = {}
+
+        settings["processing"] = options
+
+        with open('settings.json', 'w') as f:
+            json.dump(settings, f, indent=4)
+
+        messagebox.showinfo("Success", "Processing options saved successfully.")
+
     def save_api_key_to_file(self):
         api_key = self.api_key_entry.get()
         try:
@@ -442,7 +1588,16 @@ class MarsRoverImageViewer:
         # Fetch and display the actual image asynchronously
         photo = self.photos[self.current_index]
         img_url = photo['img_src']
-        threading.Thread(target=self.fetch_image, args=(img_url,)).start()
+        self.zoom_index = None
+
+        # Use the read-ahead buffer when the frame is already decoded
+        with self.frame_buffer_lock:
+            frame = self.frame_buffer.get(img_url)
+        if frame is not None:
+            self.release_full_image()
+            self.show_frame(frame)
+        else:
+            self.request_image(img_url)
 
         rover_name = photo['rover']['name']
         earth_date = photo['earth_date']
@@ -455,10 +1610,9 @@ class MarsRoverImageViewer:
 
     def display_current_image_placeholder(self):
         # Create a placeholder image
-        placeholder_image = Image.new("RGB", (400, 400), color=self.dark_gray)
-        placeholder_image = ImageTk.PhotoImage(placeholder_image)
-        self.image_label.config(image=placeholder_image)
-        self.image_label.image = placeholder_image
+        self.release_full_image()
+        self.zoom_index = None
+        self.show_frame(self.placeholder_frame)
 
         # Check if there is saved information in saveLocation
         try:
@@ -485,10 +1639,9 @@ class MarsRoverImageViewer:
 
     def display_current_image_placeholder_startup(self):
         # Create a placeholder image
-        placeholder_image = Image.new("RGB", (400, 400), color=self.dark_gray)
-        placeholder_image = ImageTk.PhotoImage(placeholder_image)
-        self.image_label.config(image=placeholder_image)
-        self.image_label.image = placeholder_image
+        self.release_full_image()
+        self.zoom_index = None
+        self.show_frame(self.placeholder_frame)
 
         # Check if there is saved information in saveLocation
         try:
@@ -610,6 +1763,7 @@ class MarsRoverImageViewer:
                 if response.status_code == 200:
                     data = response.json()
                     fetched_photos = data.get('photos', [])
+                    self.cache_manifest(rover, sol, fetched_photos)
                     if fetched_photos:
                         self.photos.extend(fetched_photos)
                         self.display_message(f"{len(fetched_photos)} images were found for the rover {rover_name} in sol year {sol}")
@@ -778,6 +1932,488 @@ class MarsRoverImageViewer:
             self.display_message("Invalid sol value.")
 
 
+    def toggle_playback(self):
+        if self.playing:
+            self.stop_playback()
+            return
+
+        if not self.photos:
+            self.display_message("Search for images before starting playback.")
+            return
+
+        fps = self.get_playback_fps()
+        if fps is None:
+            self.display_message("Please enter a valid frame rate.")
+            return
+
+        # Remember the sol range so the buffer thread can look up the next sol without touching the widgets
+        current_sol = self.selected_date.get()
+        end_sol = self.end_sol_entry.get()
+        self.playback_rover = self.selected_rover.get()
+        self.playback_sol = int(current_sol) if current_sol.isdigit() else None
+        if self.playback_sol is not None and end_sol.isdigit() and int(end_sol) > self.playback_sol:
+            self.playback_end_sol = int(end_sol)
+        else:
+            self.playback_end_sol = None
+        self.playback_next = None
+
+        self.playing = True
+        self.play_button.config(text='Stop')
+        threading.Thread(target=self.fill_frame_buffer, args=(self.playback_generation,), daemon=True).start()
+        self.playback_after_id = self.master.after(int(1000 / fps), self.playback_tick)
+
+    def get_playback_fps(self):
+        try:
+            fps = float(self.fps_entry.get())
+        except ValueError:
+            return None
+        return fps if fps > 0 else None
+
+    def stop_playback(self):
+        self.playing = False
+        self.playback_generation += 1
+        if self.playback_after_id is not None:
+            self.master.after_cancel(self.playback_after_id)
+            self.playback_after_id = None
+        self.playback_next = None
+        self.play_button.config(text='Play')
+        with self.frame_buffer_lock:
+            self.frame_buffer.clear()
+            self.failed_frames.clear()
+
+    def playback_tick(self):
+        if not self.playing:
+            return
+
+        fps = self.get_playback_fps() or 5  # Fall back to the default rate if the entry was cleared mid-playback
+
+        # Step past frames that failed to load instead of waiting on them
+        next_index = self.current_index + 1
+        with self.frame_buffer_lock:
+            while next_index < len(self.photos) and self.photos[next_index]['img_src'] in self.failed_frames:
+                next_index += 1
+            ready = next_index < len(self.photos) and self.photos[next_index]['img_src'] in self.frame_buffer
+
+        if next_index < len(self.photos):
+            # Hold on the current frame until the next one has been decoded
+            if ready:
+                self.current_index = next_index - 1
+                self.show_next_image()
+        else:
+            # Reached the last image of this sol, roll over into the next sol once the buffer thread has it ready
+            next_sol = self.playback_next
+            if self.playback_end_sol is None or (next_sol is not None and next_sol[0] is None):
+                self.stop_playback()
+                self.display_message("Playback finished.")
+                return
+
+            if next_sol is not None:
+                if next_sol[0] <= self.playback_sol:
+                    self.playback_next = None  # Looked up before the last roll over, find the one after it
+                else:
+                    first_url = next_sol[1][0]['img_src']
+                    with self.frame_buffer_lock:
+                        ready = first_url in self.frame_buffer or first_url in self.failed_frames
+                    if ready:
+                        self.start_playback_sol(*next_sol)
+
+        self.playback_after_id = self.master.after(int(1000 / fps), self.playback_tick)
+
+    def start_playback_sol(self, sol, photos):
+        self.playback_next = None
+        self.playback_sol = sol
+        self.selected_date.set(str(sol))
+        self.sol = str(sol)
+        self.photos = photos
+        self.current_index = 0
+        self.display_current_image()
+        self.display_message(f"Playing {len(photos)} images from sol {sol}...")
+
+    def find_next_playback_sol(self, after_sol, generation):
+        # Skip sols without images, the result is (None, []) once the end of the range is reached
+        for sol in range(after_sol + 1, self.playback_end_sol + 1):
+            if generation != self.playback_generation:
+                return None
+            try:
+                photos = self.fetch_manifest(self.playback_rover, sol)
+            except requests.exceptions.RequestException as e:
+                self.display_message(f"Failed to fetch images for sol {sol}: {e}")
+                time.sleep(1)
+                return None  # Try again on the buffer thread's next pass
+            if photos:
+                return sol, photos
+        return None, []
+
+    def fill_frame_buffer(self, generation):
+        # Keep the next few frames decoded so playback never waits on the network
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            while self.playing and generation == self.playback_generation:
+                ahead = self.photos[self.current_index:self.current_index + self.frame_buffer_size]
+
+                # Near the end of this sol, fetch the next sol's manifest and buffer its first frames as well
+                if len(ahead) < self.frame_buffer_size and self.playback_end_sol is not None:
+                    if self.playback_next is None:
+                        self.playback_next = self.find_next_playback_sol(self.playback_sol, generation)
+                    next_sol = self.playback_next
+                    if next_sol is not None and next_sol[1]:
+                        ahead = ahead + next_sol[1][:self.frame_buffer_size - len(ahead)]
+
+                ahead = [photo['img_src'] for photo in ahead]
+
+                # Drop frames that playback has already moved past
+                now = time.monotonic()
+                with self.frame_buffer_lock:
+                    for url in list(self.frame_buffer):
+                        if url not in ahead:
+                            del self.frame_buffer[url]
+                    for url in list(self.failed_frames):
+                        if url not in ahead:
+                            del self.failed_frames[url]
+                    # Frames that failed are only retried once their backoff has passed
+                    missing = [url for url in ahead if url not in self.frame_buffer
+                               and (url not in self.failed_frames or self.failed_frames[url][1] <= now)]
+
+                if not missing:
+                    time.sleep(0.05)
+                    continue
+
+                for url, frame in zip(missing, executor.map(self.fetch_frame, missing)):
+                    if not self.playing or generation != self.playback_generation:
+                        break
+                    with self.frame_buffer_lock:
+                        if frame is not None:
+                            self.frame_buffer[url] = frame
+                            self.failed_frames.pop(url, None)
+                        else:
+                            attempts = self.failed_frames.get(url, (0, 0))[0] + 1
+                            self.failed_frames[url] = (attempts, time.monotonic() + min(60, 2 ** attempts))
+
+    def fetch_frame(self, img_url):
+        # Return a decoded frame, reusing the read-ahead buffer when it already has it
+        with self.frame_buffer_lock:
+            frame = self.frame_buffer.get(img_url)
+        if frame is not None:
+            return frame
+
+        try:
+            img_response = requests.get(img_url)
+            img_response.raise_for_status()
+            return self.decode_image(img_response.content)
+        except requests.exceptions.RequestException as e:
+            self.display_message(f'Failed to fetch image: {e}')
+            return None
+        except OSError as e:
+            # Covers responses that are not images, such as an HTML error page
+            self.display_message(f'Failed to decode image: {e}')
+            return None
+
+    def export_sequence(self):
+        if not self.photos:
+            self.display_message("Search for images before exporting a sequence.")
+            return
+
+        file_path = filedialog.asksaveasfilename(
+            defaultextension='.gif',
+            filetypes=[('Animated GIF', '*.gif'), ('Animated WebP', '*.webp'), ('Image Strip (PNG)', '*.png'), ('Image Strip (JPEG)', '*.jpg')],
+        )
+        if not file_path:
+            return
+
+        fps = self.get_playback_fps() or 5
+
+        # Export in the background so the viewer stays responsive while frames download
+        threading.Thread(target=self.write_sequence, args=(file_path, list(self.photos), fps)).start()
+
+    def write_sequence(self, file_path, photos, fps):
+        self.display_message(f"Exporting {len(photos)} frames...")
+
+        urls = [photo['img_src'] for photo in photos]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            frames = [frame for frame in executor.map(self.fetch_frame, urls) if frame is not None]
+
+        if not frames:
+            self.display_message("No frames could be fetched for export.")
+            return
+
+        try:
+            extension = os.path.splitext(file_path)[1].lower()
+            if extension in ('.gif', '.webp'):
+                frames[0].save(file_path, save_all=True, append_images=frames[1:], duration=int(1000 / fps), loop=0)
+            else:
+                # Lay the frames out in rows of a fixed width so long sequences grow downwards
+                columns = min(self.strip_columns, len(frames))
+                rows = -(-len(frames) // columns)
+                if extension in ('.jpg', '.jpeg') and rows * 400 > 65535:
+                    self.display_message(f"{len(frames)} frames is too many for a JPEG strip, export as PNG instead.")
+                    return
+                strip = Image.new('RGB', (400 * columns, 400 * rows), color=self.dark_gray)
+                for i, frame in enumerate(frames):
+                    strip.paste(frame, (400 * (i % columns), 400 * (i // columns)))
+                strip.save(file_path)
+            self.display_message(f"Exported {len(frames)} frames to {file_path}")
+        except Exception as e:
+            self.display_message(f"Error exporting sequence: {e}")
+
+    def cache_manifest(self, rover, sol, photos):
+        key = (rover.lower(), int(sol))
+        with self.manifest_cache_lock:
+            self.manifest_cache[key] = photos
+            self.manifest_cache.move_to_end(key)
+            if len(self.manifest_cache) > self.manifest_cache_limit:
+                self.manifest_cache.popitem(last=False)
+
+    def fetch_manifest(self, rover, sol, remember=True):
+        # Use the manifest from this session if we already fetched it
+        key = (rover.lower(), int(sol))
+        with self.manifest_cache_lock:
+            photos = self.manifest_cache.get(key)
+        if photos is not None:
+            return photos
+
+        url = f'https://api.nasa.gov/mars-photos/api/v1/rovers/{rover.lower()}/photos?sol={sol}&api_key={self.api_key}'
+        response = requests.get(url)
+        response.raise_for_status()
+        photos = response.json().get('photos', [])
+        if remember:
+            self.cache_manifest(rover, sol, photos)
+        return photos
+
+    def set_export_status(self, message):
+        # Range exports report progress from their own thread, so hand the update to the Tk thread
+        if threading.current_thread() is not threading.main_thread():
+            self.master.after(0, self.set_export_status, message)
+            return
+
+        self.export_status_label.config(text=message)
+
+    def ask_manifest_path(self):
+        export_format = self.export_format.get()
+        if export_format == 'Parquet' and pa is None:
+            self.set_export_status("Parquet export requires pyarrow (pip install pyarrow).")
+            return None, None
+
+        extension = {'CSV': '.csv', 'JSON Lines': '.jsonl', 'Parquet': '.parquet'}[export_format]
+        file_path = filedialog.asksaveasfilename(defaultextension=extension, filetypes=[(export_format, f'*{extension}')])
+        return file_path or None, export_format
+
+    def export_loaded_manifest(self):
+        if not self.photos:
+            self.set_export_status("Search for images in the Viewer before exporting.")
+            return
+
+        file_path, export_format = self.ask_manifest_path()
+        if not file_path:
+            return
+
+        try:
+            count = write_manifest(file_path, export_format, [[flatten_photo(photo) for photo in self.photos]])
+            self.set_export_status(f"Exported {count} photos to {file_path}")
+        except Exception as e:
+            self.set_export_status(f"Error exporting metadata: {e}")
+
+    def export_manifest_range(self):
+        start_sol = self.export_start_entry.get()
+        end_sol = self.export_end_entry.get()
+        if not start_sol.isdigit() or not end_sol.isdigit() or int(start_sol) > int(end_sol):
+            self.set_export_status("Please enter a valid sol range.")
+            return
+
+        file_path, export_format = self.ask_manifest_path()
+        if not file_path:
+            return
+
+        rover = self.export_rover.get()
+        threading.Thread(target=self.write_manifest_range, args=(file_path, export_format, rover, int(start_sol), int(end_sol))).start()
+
+    def write_manifest_range(self, file_path, export_format, rover, start_sol, end_sol):
+        skipped = []
+
+        def batches():
+            # One sol at a time, so only a single manifest is in memory while writing
+            for sol in range(start_sol, end_sol + 1):
+                self.set_export_status(f"Exporting {rover} sol {sol} of {end_sol}...")
+                photos = self.fetch_export_manifest(rover, sol)
+                if photos is None:
+                    skipped.append(sol)
+                    continue
+                yield [flatten_photo(photo) for photo in photos]
+
+        try:
+            count = write_manifest(file_path, export_format, batches())
+        except Exception as e:
+            self.set_export_status(f"Error exporting metadata: {e}")
+            return
+
+        message = f"Exported {count} photos for {rover} sols {start_sol}-{end_sol} to {file_path}"
+        if skipped:
+            shown = ', '.join(str(sol) for sol in skipped[:20])
+            more = f" and {len(skipped) - 20} more" if len(skipped) > 20 else ''
+            message += f"\nSkipped {len(skipped)} sols that could not be fetched: {shown}{more}"
+        self.set_export_status(message)
+
+    def fetch_export_manifest(self, rover, sol):
+        # Read from the session cache without adding to it, so a long range export stays streaming
+        for attempt in range(self.export_retries + 1):
+            try:
+                return self.fetch_manifest(rover, sol, remember=False)
+            except requests.exceptions.RequestException as e:
+                if attempt == self.export_retries:
+                    return None
+                # Back off before retrying, honouring Retry-After when the API is rate limiting us
+                delay = 2 ** (attempt + 1)
+                response = getattr(e, 'response', None)
+                if response is not None and response.headers.get('Retry-After', '').isdigit():
+                    delay = int(response.headers['Retry-After'])
+                self.set_export_status(f"Sol {sol} failed ({e}), retrying in {delay} seconds...")
+                time.sleep(delay)
+
+    def load_comparison(self):
+        rovers = [rover for rover, selected in self.compare_rovers.items() if selected.get()]
+        if not rovers:
+            self.compare_status_label.config(text='Select at least one rover to compare.')
+            return
+
+        earth_date = self.compare_date_entry.get().strip()
+        try:
+            datetime.strptime(earth_date, '%Y-%m-%d')
+        except ValueError:
+            self.compare_status_label.config(text='Please enter the earth date as YYYY-MM-DD.')
+            return
+
+        prefetch_depth = self.compare_prefetch_entry.get()
+        cache_budget = self.compare_cache_entry.get()
+        if not prefetch_depth.isdigit() or not cache_budget.isdigit():
+            self.compare_status_label.config(text='Prefetch and cache must be whole numbers.')
+            return
+        if int(cache_budget) <= int(prefetch_depth):
+            # Otherwise prefetched thumbnails push out the one being shown before it is displayed
+            self.compare_status_label.config(text='Cache must be larger than prefetch.')
+            return
+
+        for pane in self.comparison_panes:
+            pane.close()
+
+        # Share the tab width between the selected rovers
+        image_size = min(280, 580 // len(rovers) - 10)
+        self.comparison_panes = [
+            ComparisonPane(self.compare_panes_frame, rover, image_size, int(prefetch_depth), int(cache_budget), self.custom_font, self.dark_gray)
+            for rover in rovers
+        ]
+
+        self.compare_status_label.config(text=f'Loading {len(rovers)} rovers for {earth_date}...')
+        threading.Thread(target=self.fetch_comparison_manifests, args=(self.comparison_panes, earth_date)).start()
+
+    def fetch_comparison_manifests(self, panes, earth_date):
+        # Request every rover's manifest at once, each pane fills in as its response arrives
+        with ThreadPoolExecutor(max_workers=len(panes)) as executor:
+            futures = {executor.submit(self.fetch_earth_date_manifest, pane.rover, earth_date): pane for pane in panes}
+            for future in as_completed(futures):
+                pane = futures[future]
+                # Hand the results to the Tk thread, which owns the pane widgets
+                try:
+                    self.master.after(0, pane.set_photos, future.result())
+                except Exception as e:
+                    self.master.after(0, pane.set_error, f'Failed to fetch images: {e}')
+
+        self.master.after(0, self.show_comparison_status, panes, earth_date)
+
+    def show_comparison_status(self, panes, earth_date):
+        if panes is self.comparison_panes:
+            self.compare_status_label.config(text=f'Comparing {", ".join(pane.rover for pane in panes)} on {earth_date}')
+
+    def fetch_earth_date_manifest(self, rover, earth_date):
+        url = f'https://api.nasa.gov/mars-photos/api/v1/rovers/{rover.lower()}/photos?earth_date={earth_date}&api_key={self.api_key}'
+        response = requests.get(url)
+        response.raise_for_status()
+        return response.json().get('photos', [])
+
+    def load_watch_settings(self):
+        watch_settings = {"rovers": [], "intervalMinutes": 10}
+        try:
+            with open('settings.json', 'r') as f:
+                settings = json.load(f)
+                watch_settings.update(settings.get("watch", {}))
+        except FileNotFoundError:
+            print("File not found")
+        return watch_settings
+
+    def toggle_watch(self):
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+            # The watcher finishes its current request before it exits, so starting again waits for it
+            self.watch_button.config(text='Stopping...', state='disabled')
+            self.wait_for_watcher()
+            return
+        if self.watch_thread is not None:
+            return  # The previous watcher is still stopping
+
+        rovers = [rover for rover, selected in self.watch_rovers.items() if selected.get()]
+        interval = self.watch_interval_entry.get()
+        download_path = self.download_path_entry.get()
+        if not rovers:
+            messagebox.showerror("Error", "Select at least one rover to watch.")
+            return
+        if not interval.isdigit() or int(interval) < 1:
+            messagebox.showerror("Error", "Watch interval must be a whole number of minutes.")
+            return
+        if not download_path:
+            messagebox.showerror("Error", "Configure a download path so new images can be saved.")
+            return
+
+        options = self.get_processing_options()
+        if options is None:
+            return
+
+        # Remember the watch list for next time and for the command line
+        try:
+            with open('settings.json', 'r') as f:
+                settings = json.load(f)
+        except FileNotFoundError:
+            settings = {}
+        settings["watch"] = {"rovers": rovers, "intervalMinutes": int(interval)}
+        with open('settings.json', 'w') as f:
+            json.dump(settings, f, indent=4)
+
+        self.watcher = RoverWatcher(self.api_key, self.get_download_store(download_path), rovers, int(interval) * 60, options, self.notify_watch)
+        self.watch_thread = threading.Thread(target=self.watcher.run, daemon=True)
+        self.watch_thread.start()
+        self.watch_button.config(text='Stop Watching')
+        self.display_message(f"Watching {', '.join(rovers)} every {interval} minutes.")
+
+    def wait_for_watcher(self):
+        if self.watch_thread.is_alive():
+            self.master.after(200, self.wait_for_watcher)
+            return
+
+        self.watch_thread.join()
+        self.watch_thread = None
+        self.watch_button.config(text='Start Watching', state='normal')
+        self.display_message("Stopped watching for new images.")
+
+    def notify_watch(self, message, new_sol):
+        # Called from the watcher thread, so hand the message to the Tk thread
+        self.master.after(0, self.show_watch_notification, message, new_sol)
+
+    def show_watch_notification(self, message, new_sol):
+        self.display_message(f"[{datetime.now().strftime('%H:%M')}] {message}")
+        if new_sol:
+            self.master.bell()
+
+    def update_memory_readout(self):
+        rss = get_rss_bytes()
+        rss_text = f'{rss / (1024 * 1024):.1f} MB' if rss is not None else 'unavailable'
+        with self.frame_buffer_lock:
+            buffered_frames = len(self.frame_buffer)
+        with self.manifest_cache_lock:
+            cached_manifests = len(self.manifest_cache)
+        thumbnails = sum(len(pane.cache) for pane in self.comparison_panes)
+        full_image = f'{self.full_image.size[0]}x{self.full_image.size[1]}' if self.full_image is not None else 'none'
+
+        self.memory_label.config(text=f'Memory: {rss_text}\nFull image: {full_image}, tiles: {len(self.tile_cache)}, '
+                                      f'playback frames: {buffered_frames}\nManifests: {cached_manifests}, compare thumbnails: {thumbnails}')
+        self.master.after(2000, self.update_memory_readout)
+
     def fetch_rover_names(self):
             url = "https://api.nasa.gov/mars-photos/api/v1/rovers/?api_key=DEMO_KEY"
             try:
@@ -820,12 +2456,56 @@ class MarsRoverImageViewer:
         else:
             messagebox.showerror("Error", "Download path cannot be empty.")
 
+def watch_from_command_line(rovers, interval_minutes):
+    # Headless watch mode, uses the API key, download path and processing options saved in settings.json
+    try:
+        with open('settings.json', 'r') as f:
+            settings = json.load(f)
+    except FileNotFoundError:
+        settings = {}
+
+    download_path = settings.get("downloadPath", "")
+    if not download_path:
+        print("Configure a download path in the Settings tab before watching.")
+        sys.exit(1)
+
+    options = dict(DEFAULT_PROCESSING_OPTIONS)
+    options.update(settings.get("processing", {}))
+    rovers = rovers or settings.get("watch", {}).get("rovers", [])
+    if not rovers:
+        print("Name at least one rover to watch.")
+        sys.exit(1)
+
+    def notify(message, new_sol):
+        prefix = 'NEW SOL ' if new_sol else ''
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {prefix}{message}", flush=True)
+
+    watcher = RoverWatcher(settings.get("apiKey", ""), DownloadStore(download_path), rovers, interval_minutes * 60, options, notify)
+    print(f"Watching {', '.join(rovers)} every {interval_minutes:g} minutes. Press Ctrl+C to stop.")
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        watcher.stop()
+
 def main():
+    parser = argparse.ArgumentParser(description='GUI for viewing and downloading NASA Mars Rover Images.')
+    parser.add_argument('--watch', nargs='*', metavar='ROVER', help='watch rovers for new images without opening the window (defaults to the rovers saved in settings)')
+    parser.add_argument('--interval', type=float, default=10, metavar='MINUTES', help='minutes between checks in watch mode (default: 10)')
+    args = parser.parse_args()
+    if args.interval < 1:
+        parser.error('--interval must be at least 1 minute')
+
+    if args.watch is not None:
+        watch_from_command_line(args.watch, args.interval)
+        return
+
     window = tk.Tk()
     window.iconphoto(True, tk.PhotoImage(file='Images/rover-icon2.png'))
     app = MarsRoverImageViewer(window)
 
     def on_closing():
+        if app.watcher is not None:
+            app.watcher.stop()
         if messagebox.askokcancel("Quit", "Would you like to save your place so you can browse later?"):
             # Run the save_image_info_to_file function
             app.save_image_info_to_file(app.selected_rover.get(), app.selected_date.get(), app.current_index + 1)
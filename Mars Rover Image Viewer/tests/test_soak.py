@@ -0,0 +1,165 @@
+"""
+Memory soak test for the viewer's image lifecycle.
+
+Pages through thousands of images on the real threaded fetch path (request_image -> fetch_image ->
+display_image) with requests.get stubbed out, while a comparison pane and the playback read-ahead
+buffer run alongside, and checks that resident memory levels off.
+
+Needs a display. On a headless machine run it under Xvfb:
+    xvfb-run python -m pytest tests
+Set SOAK_IMAGES to change the number of images (default 2000). Set SOAK_REQUIRE_DISPLAY=1 in CI so a
+missing display fails the run instead of skipping it.
+"""
+
+import os
+import sys
+import time
+import tkinter as tk
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+import main
+
+SOAK_IMAGES = int(os.environ.get('SOAK_IMAGES', '2000'))
+
+HAS_DISPLAY = not sys.platform.startswith('linux') or bool(os.environ.get('DISPLAY'))
+
+if not HAS_DISPLAY and os.environ.get('SOAK_REQUIRE_DISPLAY'):
+    raise RuntimeError('SOAK_REQUIRE_DISPLAY is set but there is no display, run under xvfb-run')
+
+pytestmark = pytest.mark.skipif(not HAS_DISPLAY, reason='needs a display, run under Xvfb')
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, content):
+        self.content = content
+        self.headers = {'Content-Length': str(len(content))}
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def make_photos(count, prefix):
+    return [
+        {
+            'id': i,
+            'sol': 1000,
+            'earth_date': '2015-05-30',
+            'img_src': f'https://soak.test/{prefix}/{i}.jpg',
+            'camera': {'name': 'NAVCAM'},
+            'rover': {'name': 'Curiosity', 'status': 'active'},
+        }
+        for i in range(count)
+    ]
+
+
+def pump(root, condition, timeout=10):
+    # Run the Tk event loop until the condition holds, so after(0, ...) callbacks from workers are processed
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out waiting for the viewer'
+        root.update()
+        time.sleep(0.001)
+
+
+def assert_levels_off(samples):
+    if None in samples:
+        pytest.skip('resident memory cannot be read on this platform')
+
+    # After the first half, memory should stay flat apart from allocator noise
+    settled = samples[len(samples) // 2]
+    growth = samples[-1] - settled
+    assert growth < max(20 * 1024 * 1024, settled * 0.1), [f'{rss / (1024 * 1024):.1f} MB' for rss in samples]
+
+
+@pytest.fixture
+def app(monkeypatch):
+    variants = []
+    for i in range(5):
+        data = BytesIO()
+        Image.effect_noise((1600 + 100 * i, 1200), 64).convert('RGB').save(data, format='JPEG', quality=85)
+        variants.append(data.getvalue())
+
+    def fake_get(url, *args, **kwargs):
+        return FakeResponse(variants[hash(url) % len(variants)])
+
+    monkeypatch.setattr(main.requests, 'get', fake_get)
+    monkeypatch.chdir(APP_DIR)  # settings.json and about.md are read from the working directory
+
+    root = tk.Tk()
+    root.withdraw()
+    viewer = main.MarsRoverImageViewer(root)
+    yield viewer
+    for pane in viewer.comparison_panes:
+        pane.close()
+    viewer.stop_playback()
+    root.destroy()
+
+
+def test_memory_levels_off_while_paging(app):
+    root = app.master
+    step = max(1, SOAK_IMAGES // 20)
+
+    pane = main.ComparisonPane(app.compare_panes_frame, 'Curiosity', 135, 3, 20, app.custom_font, app.dark_gray)
+    app.comparison_panes = [pane]
+    pane.set_photos(make_photos(SOAK_IMAGES, 'compare'))
+
+    app.photos = make_photos(SOAK_IMAGES, 'viewer')
+    samples = []
+    for i in range(SOAK_IMAGES):
+        # Every so often skip ahead quickly so some requests are cancelled or finish after the user moved on
+        if i % 25 == 0:
+            for j in range(i + 1, min(i + 4, SOAK_IMAGES)):
+                app.current_index = j
+                app.display_current_image()
+
+        app.current_index = i
+        app.display_current_image()
+        img_url = app.photos[i]['img_src']
+        pump(root, lambda: app.full_image_url == img_url)
+
+        # Zoom into every tenth image to exercise the tile cache
+        if i % 10 == 0:
+            app.zoom_index = 2
+            app.render_viewport()
+
+        pane.show_next()
+
+        if (i + 1) % step == 0:
+            samples.append(main.get_rss_bytes())
+
+    assert_levels_off(samples)
+
+
+def test_memory_levels_off_during_playback(app):
+    root = app.master
+    step = max(1, SOAK_IMAGES // 20)
+
+    app.photos = make_photos(SOAK_IMAGES, 'playback')
+    app.current_index = 0
+    app.selected_date.set('')  # No sol range, playback stops at the last image
+    app.fps_entry.delete(0, tk.END)
+    app.fps_entry.insert(0, '500')
+    app.toggle_playback()
+
+    samples = []
+
+    def finished():
+        if app.current_index // step > len(samples):
+            samples.append(main.get_rss_bytes())
+        return not app.playing
+
+    pump(root, finished, timeout=SOAK_IMAGES)
+
+    assert app.current_index == SOAK_IMAGES - 1
+    assert_levels_off(samples)